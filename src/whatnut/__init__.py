@@ -10,6 +10,7 @@ from whatnut.config import (
     get_mortality_curve,
     get_quality_curve,
     get_cause_fractions,
+    get_cause_fraction_curves,
     validate,
 )
 from whatnut.evidence import SOURCES, Source, EffectSize, get_source, validate_sources
@@ -30,6 +31,7 @@ __all__ = [
     "get_mortality_curve",
     "get_quality_curve",
     "get_cause_fractions",
+    "get_cause_fraction_curves",
     "validate",
     # Evidence
     "SOURCES",
@@ -243,7 +243,14 @@ def _extract_model_nutrients(raw_nutrients: dict) -> dict[str, float]:
 
 
 def get_nut(nut_id: str) -> NutProfile:
-    """Get a complete nut profile by ID."""
+    """Get a complete nut profile by ID.
+
+    Profiles are immutable, so the built NutProfile is cached per id —
+    the model and pipeline look nuts up repeatedly in per-pathway loops.
+    """
+    cache_key = f"nut:{nut_id}"
+    if cache_key in _cache:
+        return _cache[cache_key]
     data = load_nuts_yaml()
     if nut_id not in data:
         raise ValueError(f"Unknown nut: {nut_id}. Available: {list(data.keys())}")
@@ -255,7 +262,7 @@ def get_nut(nut_id: str) -> NutProfile:
         for p in PATHWAYS
         if p in adj
     }
-    return NutProfile(
+    profile = NutProfile(
         id=nut_id,
         fdc_id=raw["fdc_id"],
         nutrients=model_nutrients,
@@ -263,6 +270,8 @@ def get_nut(nut_id: str) -> NutProfile:
         cost_per_kg_usd=raw["cost_per_kg_usd"],
         evidence=raw.get("evidence", "limited"),
     )
+    _cache[cache_key] = profile
+    return profile
 
 
 def get_all_nuts() -> list[NutProfile]:
@@ -316,8 +325,19 @@ def get_mortality_rate(age: int) -> float:
 
 
 def get_mortality_curve(start_age: int, max_age: int = 110) -> np.ndarray:
-    """Get mortality rates from start_age to max_age."""
-    return np.array([get_mortality_rate(a) for a in range(start_age, max_age + 1)])
+    """Get mortality rates from start_age to max_age.
+
+    The interpolated curve is cached per (start_age, max_age): the
+    lifecycle model requests the same grid once per nut, and the per-age
+    Python interpolation dominates its runtime. A copy is returned so
+    callers can safely modify the result.
+    """
+    key = ("mortality_curve", start_age, max_age)
+    if key not in _cache:
+        _cache[key] = np.array(
+            [get_mortality_rate(a) for a in range(start_age, max_age + 1)]
+        )
+    return _cache[key].copy()
 
 
 def get_quality_weight(age: int) -> float:
@@ -327,41 +347,78 @@ def get_quality_weight(age: int) -> float:
 
 
 def get_quality_curve(start_age: int, max_age: int = 110) -> np.ndarray:
-    """Get quality weights from start_age to max_age."""
-    return np.array([get_quality_weight(a) for a in range(start_age, max_age + 1)])
+    """Get quality weights from start_age to max_age.
+
+    Cached per (start_age, max_age) like get_mortality_curve; a copy is
+    returned so callers can safely modify the result.
+    """
+    key = ("quality_curve", start_age, max_age)
+    if key not in _cache:
+        _cache[key] = np.array(
+            [get_quality_weight(a) for a in range(start_age, max_age + 1)]
+        )
+    return _cache[key].copy()
+
+
+def _cause_fraction_arrays() -> tuple[np.ndarray, np.ndarray]:
+    """Contiguous knot arrays for cause-fraction interpolation.
+
+    Returns (knot_ages, fractions) where fractions has shape (n_knots, 3)
+    with columns (cvd, cancer, other). Anchor rows are renormalized to sum
+    to exactly 1.0 (the YAML values are rounded to three decimals, so raw
+    sums can drift by ~0.001). Built once from cause_fractions.yaml and
+    cached; interpolation then runs over contiguous float64 memory instead
+    of per-age dict lookups.
+    """
+    if "cause_fraction_arrays" not in _cache:
+        raw = load_cause_fractions()["fractions"]
+        knots = sorted(raw)
+        knot_ages = np.array(knots, dtype=np.float64)
+        fractions = np.array(
+            [[raw[a][c] for c in ("cvd", "cancer", "other")] for a in knots],
+            dtype=np.float64,
+        )
+        totals = fractions.sum(axis=1, keepdims=True)
+        fractions = np.where(totals > 0, fractions / totals, fractions)
+        _cache["cause_fraction_arrays"] = (knot_ages, fractions)
+    return _cache["cause_fraction_arrays"]
+
+
+def get_cause_fraction_curves(
+    start_age: int, max_age: int = 110
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Get (cvd, cancer, other) cause-fraction curves from start_age to max_age.
+
+    Vectorized companion to get_cause_fractions for the unit-spaced age
+    grids the lifecycle model runs on: one np.interp pass per cause over
+    the contiguous knot arrays replaces a per-age Python loop. np.interp
+    exploits the monotonically increasing query ages internally (its
+    guessed-index binary search), so the cost is linear in the number of
+    ages rather than n_ages * log(n_knots).
+    """
+    knot_ages, fractions = _cause_fraction_arrays()
+    ages = np.arange(start_age, max_age + 1, dtype=np.float64)
+    return (
+        np.interp(ages, knot_ages, fractions[:, 0]),
+        np.interp(ages, knot_ages, fractions[:, 1]),
+        np.interp(ages, knot_ages, fractions[:, 2]),
+    )
 
 
 def get_cause_fractions(age: int) -> tuple[float, float, float]:
     """Get (cvd, cancer, other) cause fractions for a given age.
 
-    Values are interpolated linearly from the NVSR-sourced anchor grid
-    in cause_fractions.yaml and then renormalized so the triple sums to
-    exactly 1.0 (anchors are rounded to three decimals, so raw sums can
-    drift by ~0.001 between anchors).
+    Values are interpolated linearly from the NVSR-sourced anchor grid in
+    cause_fractions.yaml. Anchors are normalized before interpolation, so
+    any convex combination of them sums to exactly 1.0; ages outside the
+    anchor range clamp to the end values (np.interp semantics, matching the
+    previous table-edge behavior).
     """
-    def _normalize(cvd: float, cancer: float, other: float) -> tuple[float, float, float]:
-        total = cvd + cancer + other
-        if total <= 0:
-            return cvd, cancer, other
-        return cvd / total, cancer / total, other / total
-
-    raw = load_cause_fractions()["fractions"]
-    ages = sorted(raw.keys())
-    if age <= ages[0]:
-        d = raw[ages[0]]
-        return _normalize(d["cvd"], d["cancer"], d["other"])
-    if age >= ages[-1]:
-        d = raw[ages[-1]]
-        return _normalize(d["cvd"], d["cancer"], d["other"])
-    lower_age = max(a for a in ages if a <= age)
-    upper_age = min(a for a in ages if a > age)
-    frac = (age - lower_age) / (upper_age - lower_age)
-    lower = raw[lower_age]
-    upper = raw[upper_age]
-    return _normalize(
-        lower["cvd"] + frac * (upper["cvd"] - lower["cvd"]),
-        lower["cancer"] + frac * (upper["cancer"] - lower["cancer"]),
-        lower["other"] + frac * (upper["other"] - lower["other"]),
+    knot_ages, fractions = _cause_fraction_arrays()
+    return (
+        float(np.interp(age, knot_ages, fractions[:, 0])),
+        float(np.interp(age, knot_ages, fractions[:, 1])),
+        float(np.interp(age, knot_ages, fractions[:, 2])),
     )
 
 
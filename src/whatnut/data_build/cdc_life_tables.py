@@ -23,7 +23,6 @@ import urllib.request
 from pathlib import Path
 
 import openpyxl
-import yaml
 
 from whatnut.data_build import DATA_DIR, RAW_DIR
 
@@ -20,7 +20,6 @@ import json
 import sys
 import urllib.request
 import zipfile
-from pathlib import Path
 
 import yaml
 
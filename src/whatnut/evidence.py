@@ -249,12 +249,13 @@ SOURCES: list[Source] = [
 ]
 
 
+# ID index built once at import; SOURCES is a module-level constant.
+_SOURCES_BY_ID: dict[str, Source] = {source.id: source for source in SOURCES}
+
+
 def get_source(source_id: str) -> Optional[Source]:
     """Get a source by ID."""
-    for source in SOURCES:
-        if source.id == source_id:
-            return source
-    return None
+    return _SOURCES_BY_ID.get(source_id)
 
 
 def validate_sources() -> list[str]:
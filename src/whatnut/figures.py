@@ -397,7 +397,7 @@ def fig5_confounding_calibration():
 
 def fig6_nutrient_contributions():
     """Heatmap showing nutrient contributions to each nut's effect."""
-    from whatnut.config import get_nutrient_matrix, get_pathway_priors, NUT_IDS, NUTRIENTS
+    from whatnut.config import get_pathway_priors, NUT_IDS
 
     nuts = list(NUT_IDS)
     cvd_priors = get_pathway_priors('cvd')
@@ -15,7 +15,7 @@ from dataclasses import dataclass
 import numpy as np
 
 from whatnut.config import (
-    get_cause_fractions,
+    get_cause_fraction_curves,
     get_mortality_curve,
     get_quality_curve,
 )
@@ -88,34 +88,30 @@ def run_lifecycle(
     Returns:
         LifecycleResult with life years, QALYs, costs, and ICER.
     """
-    ages = np.arange(start_age, max_age + 1)
-    n_years = len(ages)
+    n_years = max_age - start_age + 1
 
     mortality_baseline = get_mortality_curve(start_age, max_age)
     quality_weights = get_quality_curve(start_age, max_age)
 
     # Age-specific weighted RR based on cause-of-death mix
-    weighted_rr = np.empty(n_years)
-    cvd_fracs = np.empty(n_years)
-    cancer_fracs = np.empty(n_years)
-    other_fracs = np.empty(n_years)
-
-    for i, age in enumerate(ages):
-        cvd_frac, cancer_frac, other_frac = get_cause_fractions(age)
-        cvd_fracs[i] = cvd_frac
-        cancer_fracs[i] = cancer_frac
-        other_fracs[i] = other_frac
-        weighted_rr[i] = cvd_frac * rr_cvd + cancer_frac * rr_cancer + other_frac * rr_other
+    cvd_fracs, cancer_fracs, other_fracs = get_cause_fraction_curves(start_age, max_age)
+    weighted_rr = cvd_fracs * rr_cvd + cancer_fracs * rr_cancer + other_fracs * rr_other
 
     # Intervention mortality
     mortality_intervention = mortality_baseline * weighted_rr
 
-    # Survival curves
-    survival_baseline = np.cumprod(1 - mortality_baseline)
-    survival_baseline = np.insert(survival_baseline[:-1], 0, 1.0)
+    # Survival at the START of each age year: survival[0] = 1.0 and
+    # survival[i] = prod(1 - q) over the first i hazards. Only the first
+    # n_years - 1 hazards feed the curve, so cumprod writes straight into
+    # the shifted slice rather than computing a full-length cumprod and
+    # shift-inserting the leading 1.0 afterwards.
+    survival_baseline = np.empty(n_years)
+    survival_baseline[0] = 1.0
+    np.cumprod(1 - mortality_baseline[:-1], out=survival_baseline[1:])
 
-    survival_intervention = np.cumprod(1 - mortality_intervention)
-    survival_intervention = np.insert(survival_intervention[:-1], 0, 1.0)
+    survival_intervention = np.empty(n_years)
+    survival_intervention[0] = 1.0
+    np.cumprod(1 - mortality_intervention[:-1], out=survival_intervention[1:])
 
     # Life years gained by age
     ly_gained_by_age = survival_intervention - survival_baseline
@@ -132,9 +128,11 @@ def run_lifecycle(
     cancer_contrib_by_age = cancer_reduction / safe_total
     other_contrib_by_age = other_reduction / safe_total
 
-    ly_cvd = float(np.sum(ly_gained_by_age * cvd_contrib_by_age))
-    ly_cancer = float(np.sum(ly_gained_by_age * cancer_contrib_by_age))
-    ly_other = float(np.sum(ly_gained_by_age * other_contrib_by_age))
+    # Weighted reductions collapse to dot products: fused multiply-add in
+    # one BLAS call instead of an elementwise product plus a separate sum.
+    ly_cvd = float(np.dot(ly_gained_by_age, cvd_contrib_by_age))
+    ly_cancer = float(np.dot(ly_gained_by_age, cancer_contrib_by_age))
+    ly_other = float(np.dot(ly_gained_by_age, other_contrib_by_age))
 
     # QALYs (undiscounted)
     qaly_gain_by_age = ly_gained_by_age * quality_weights
@@ -142,13 +140,14 @@ def run_lifecycle(
 
     # Discounting
     qaly_discount_factors = 1 / (1 + qaly_discount_rate) ** np.arange(n_years)
-    ly_gained_disc = float(np.sum(ly_gained_by_age * qaly_discount_factors))
-    qalys_gained_disc = float(np.sum(qaly_gain_by_age * qaly_discount_factors))
+    ly_gained_disc = float(np.dot(ly_gained_by_age, qaly_discount_factors))
+    qalys_gained_disc = float(np.dot(qaly_gain_by_age, qaly_discount_factors))
 
     # Costs
-    annual_costs = annual_cost * survival_intervention
     cost_discount_factors = 1 / (1 + cost_discount_rate) ** np.arange(n_years)
-    total_cost_disc = float(np.sum(annual_costs * cost_discount_factors))
+    total_cost_disc = annual_cost * float(
+        np.dot(survival_intervention, cost_discount_factors)
+    )
 
     # ICER. Treat QALYs within float-noise of zero as zero so a neutral
     # scenario (no benefit, RR=1.0) returns +inf rather than a huge but
@@ -160,9 +159,10 @@ def run_lifecycle(
     )
 
     # Overall pathway contributions (weighted by discounted LY)
-    ly_cvd_disc = float(np.sum(ly_gained_by_age * cvd_contrib_by_age * qaly_discount_factors))
-    ly_cancer_disc = float(np.sum(ly_gained_by_age * cancer_contrib_by_age * qaly_discount_factors))
-    ly_other_disc = float(np.sum(ly_gained_by_age * other_contrib_by_age * qaly_discount_factors))
+    ly_disc_by_age = ly_gained_by_age * qaly_discount_factors
+    ly_cvd_disc = float(np.dot(ly_disc_by_age, cvd_contrib_by_age))
+    ly_cancer_disc = float(np.dot(ly_disc_by_age, cancer_contrib_by_age))
+    ly_other_disc = float(np.dot(ly_disc_by_age, other_contrib_by_age))
 
     cvd_contribution = ly_cvd_disc / ly_gained_disc if ly_gained_disc > 0 else 0
     cancer_contribution = ly_cancer_disc / ly_gained_disc if ly_gained_disc > 0 else 0
@@ -171,9 +171,9 @@ def run_lifecycle(
     # artifacts near null RRs (e.g., cashew's cancer contribution at -0.00
     # or CVD at 1.01 when cancer_RR ≈ 1.0001). The ratios remain exact
     # algebraically; this clamp only affects reported round numbers.
-    cvd_contribution = float(np.clip(cvd_contribution, 0.0, 1.0))
-    cancer_contribution = float(np.clip(cancer_contribution, 0.0, 1.0))
-    other_contribution = float(np.clip(other_contribution, 0.0, 1.0))
+    cvd_contribution = min(1.0, max(0.0, cvd_contribution))
+    cancer_contribution = min(1.0, max(0.0, cancer_contribution))
+    other_contribution = min(1.0, max(0.0, other_contribution))
 
     return LifecycleResult(
         life_years_cvd=ly_cvd,
@@ -210,17 +210,12 @@ def run_lifecycle_vectorized(
     rr_cancer = np.asarray(rr_cancer)
     rr_other = np.asarray(rr_other)
 
-    ages = np.arange(start_age, max_age + 1)
-    n_years = len(ages)
+    n_years = max_age - start_age + 1
 
     mortality_baseline = get_mortality_curve(start_age, max_age)
     quality_weights = get_quality_curve(start_age, max_age)
 
-    cvd_fracs = np.empty(n_years)
-    cancer_fracs = np.empty(n_years)
-    other_fracs = np.empty(n_years)
-    for i, age in enumerate(ages):
-        cvd_fracs[i], cancer_fracs[i], other_fracs[i] = get_cause_fractions(age)
+    cvd_fracs, cancer_fracs, other_fracs = get_cause_fraction_curves(start_age, max_age)
 
     # weighted_rr: (n_samples, n_years)
     weighted_rr = (
@@ -230,14 +225,15 @@ def run_lifecycle_vectorized(
     )
     mortality_intervention = mortality_baseline[None, :] * weighted_rr
 
-    survival_baseline = np.cumprod(1 - mortality_baseline)
-    survival_baseline = np.insert(survival_baseline[:-1], 0, 1.0)
+    # Start-of-year survival, written directly into the shifted slice (see
+    # run_lifecycle): no full-length cumprod plus insert/concatenate pass.
+    survival_baseline = np.empty(n_years)
+    survival_baseline[0] = 1.0
+    np.cumprod(1 - mortality_baseline[:-1], out=survival_baseline[1:])
 
-    survival_intervention = np.cumprod(1 - mortality_intervention, axis=1)
-    survival_intervention = np.concatenate(
-        [np.ones((mortality_intervention.shape[0], 1)), survival_intervention[:, :-1]],
-        axis=1,
-    )
+    survival_intervention = np.empty_like(mortality_intervention)
+    survival_intervention[:, 0] = 1.0
+    np.cumprod(1 - mortality_intervention[:, :-1], axis=1, out=survival_intervention[:, 1:])
 
     ly_gained_by_age = survival_intervention - survival_baseline[None, :]
     ly_total = np.sum(ly_gained_by_age, axis=1)
@@ -248,11 +244,12 @@ def run_lifecycle_vectorized(
     qaly_discount = (1 / (1 + qaly_discount_rate) ** np.arange(n_years))
     cost_discount = (1 / (1 + cost_discount_rate) ** np.arange(n_years))
 
-    ly_disc = np.sum(ly_gained_by_age * qaly_discount[None, :], axis=1)
-    qalys_disc = np.sum(qaly_gain_by_age * qaly_discount[None, :], axis=1)
+    # Matrix-vector products replace broadcast-multiply-then-sum reductions
+    # over the age axis (one BLAS gemv each, no (n_samples, n_years) temps).
+    ly_disc = ly_gained_by_age @ qaly_discount
+    qalys_disc = qaly_gain_by_age @ qaly_discount
 
-    annual_costs = annual_cost * survival_intervention
-    total_cost_disc = np.sum(annual_costs * cost_discount[None, :], axis=1)
+    total_cost_disc = annual_cost * (survival_intervention @ cost_discount)
 
     qalys_positive = qalys_disc > 1e-12
     cost_per_qaly = np.where(
@@ -107,18 +107,17 @@ def sample_model(
         mu = np.array([priors[n].mean for n in NUTRIENTS])
         sigma = np.array([priors[n].sd for n in NUTRIENTS])
 
-        # Sample betas: (n_samples, n_nutrients)
-        beta = rng.normal(
-            mu[np.newaxis, :],
-            sigma[np.newaxis, :],
-            size=(n_samples, n_nutrients),
-        )
+        # Sample betas: (n_samples, n_nutrients). Drawn as standard normals
+        # scaled/shifted by broadcasting — same PCG64 stream as rng.normal
+        # (which applies the identical transform internally) but without
+        # its per-call loc/scale broadcasting machinery.
+        beta = mu + sigma * rng.standard_normal(size=(n_samples, n_nutrients))
 
         # Expected log-RR: (n_samples, n_nuts) = (n_samples, n_nutrients) @ (n_nutrients, n_nuts)
         expected_log_rr = beta @ X.T
 
         # Hierarchical deviation: tau * z
-        tau = np.abs(rng.normal(0, tau_prior.sigma, size=(n_samples, 1)))
+        tau = np.abs(tau_prior.sigma * rng.standard_normal(size=(n_samples, 1)))
         z = rng.standard_normal(size=(n_samples, n_nuts))
         true_log_rr = expected_log_rr + tau * z
 
@@ -149,14 +148,27 @@ def sample_model(
         # Following optiqal, only the central estimate is shrunk; adj.sd is
         # left alone so uncertainty reflects replication risk, not the
         # shrinkage itself.
+        #
+        # The adjustment draws for all adjusted nuts come from one batched
+        # rng.standard_normal call, scaled/shifted by the per-column
+        # means/sds (stream-identical to rng.normal, as with the beta
+        # draws above), rather than one call per nut.
+        adj_cols: list[int] = []
+        adj_means: list[float] = []
+        adj_sds: list[float] = []
         for k, nid in enumerate(nut_ids):
             nut = get_nut(nid)
             if pathway in nut.pathway_adjustments:
                 adj = nut.pathway_adjustments[pathway]
                 retention = shrinkage.retention(nut.evidence)
-                shrunk_mean = 1.0 + (adj.mean - 1.0) * retention
-                a = rng.normal(shrunk_mean, adj.sd, size=n_samples)
-                true_log_rr[:, k] *= a
+                adj_cols.append(k)
+                adj_means.append(1.0 + (adj.mean - 1.0) * retention)
+                adj_sds.append(adj.sd)
+        if adj_cols:
+            a = np.array(adj_means) + np.array(adj_sds) * rng.standard_normal(
+                size=(n_samples, len(adj_cols))
+            )
+            true_log_rr[:, adj_cols] *= a
 
         # Apply confounding adjustment
         causal_log_rr = true_log_rr * causal_fraction[:, np.newaxis]
@@ -181,14 +193,18 @@ def summarize_rr(samples: ModelSamples) -> dict[str, dict[str, dict]]:
     summary = {}
     for pathway in PATHWAYS:
         rr = samples.rr[pathway]
-        pathway_summary = {}
-        for j, nut_id in enumerate(samples.nut_ids):
-            vals = rr[:, j]
-            pathway_summary[nut_id] = {
-                "mean": float(np.mean(vals)),
-                "median": float(np.median(vals)),
-                "ci_lower": float(np.percentile(vals, 2.5)),
-                "ci_upper": float(np.percentile(vals, 97.5)),
+        # Reduce all nut columns at once along the sample axis instead of
+        # slicing per nut; the percentile call also shares one sort.
+        means = np.mean(rr, axis=0)
+        medians = np.median(rr, axis=0)
+        ci_lower, ci_upper = np.percentile(rr, [2.5, 97.5], axis=0)
+        summary[pathway] = {
+            nut_id: {
+                "mean": float(means[j]),
+                "median": float(medians[j]),
+                "ci_lower": float(ci_lower[j]),
+                "ci_upper": float(ci_upper[j]),
             }
-        summary[pathway] = pathway_summary
+            for j, nut_id in enumerate(samples.nut_ids)
+        }
     return summary
@@ -15,16 +15,14 @@ import numpy as np
 from scipy.stats import beta as beta_dist
 
 from whatnut.config import (
-    NUT_IDS,
-    PATHWAYS,
     get_confounding_prior,
     get_mortality_curve,
     get_nut,
     get_quality_curve,
     load_constants,
 )
-from whatnut.lifecycle import LifecycleResult, run_lifecycle, run_lifecycle_vectorized
-from whatnut.model import ModelSamples, sample_model
+from whatnut.lifecycle import run_lifecycle, run_lifecycle_vectorized
+from whatnut.model import sample_model
 
 
 @dataclass
@@ -156,6 +154,13 @@ class AnalysisResults:
         return d
 
 
+# Completed analyses keyed by the full (resolved) parameter tuple. The
+# analysis is deterministic given its parameters, so repeat calls — e.g.
+# the sensitivity table re-running the base case at doc-build time — can
+# return the prior result. Callers must treat cached results as read-only.
+_analysis_cache: dict[tuple, AnalysisResults] = {}
+
+
 def run_analysis(
     n_samples: int = 10_000,
     seed: int = 42,
@@ -164,6 +169,7 @@ def run_analysis(
     cost_discount_rate: float = 0.03,
     confounding_alpha: float | None = None,
     confounding_beta: float | None = None,
+    use_cache: bool = True,
 ) -> AnalysisResults:
     """Run full analysis: model sampling -> lifecycle -> summary.
 
@@ -175,6 +181,9 @@ def run_analysis(
         cost_discount_rate: Annual discount rate for costs.
         confounding_alpha: Beta prior alpha for causal fraction (default: from priors.yaml).
         confounding_beta: Beta prior beta for causal fraction (default: from priors.yaml).
+        use_cache: Return the memoized result for identical parameters.
+            Pass False to force a fresh end-to-end run (used by the
+            reproducibility tests).
 
     Returns:
         AnalysisResults with every number needed for the paper.
@@ -186,6 +195,18 @@ def run_analysis(
     if confounding_beta is None:
         confounding_beta = conf_prior.beta
 
+    cache_key = (
+        n_samples,
+        seed,
+        start_age,
+        qaly_discount_rate,
+        cost_discount_rate,
+        confounding_alpha,
+        confounding_beta,
+    )
+    if use_cache and cache_key in _analysis_cache:
+        return _analysis_cache[cache_key]
+
     # Derive 95% CI from the actual Beta(alpha, beta) parameters rather
     # than relying on the YAML hints; keeps the paper in sync with priors.
     confounding_ci_lower = float(beta_dist.ppf(0.025, confounding_alpha, confounding_beta))
@@ -200,8 +221,9 @@ def run_analysis(
     # Lx-based method CDC uses internally; documented in appendix.
     mortality = get_mortality_curve(start_age)
     quality = get_quality_curve(start_age)
-    survival_raw = np.cumprod(1 - mortality)
-    survival = np.insert(survival_raw[:-1], 0, 1.0)
+    survival = np.empty(len(mortality))
+    survival[0] = 1.0
+    np.cumprod(1 - mortality[:-1], out=survival[1:])
     baseline_life_years = float(np.sum(survival))
     baseline_qalys = float(np.sum(survival * quality))
     average_quality_weight = (
@@ -240,13 +262,19 @@ def run_analysis(
         life_years = vec.life_years_gained
         icers = vec.cost_per_qaly
 
-        # Summarize
+        # Summarize. Quantiles for each array are fused into a single
+        # np.percentile call (one partition pass) instead of separate
+        # 2.5/50/97.5 evaluations.
         icer_finite = icers[np.isfinite(icers) & (icers > 0)]
-        icer_upper = (
-            float(np.percentile(icer_finite, 97.5))
-            if len(icer_finite) > 0 and np.percentile(qalys_disc, 2.5) > 0
-            else None
-        )
+        ly_lower, ly_upper = np.percentile(life_years, [2.5, 97.5])
+        qaly_lower, qaly_upper = np.percentile(qalys_disc, [2.5, 97.5])
+        if len(icer_finite) > 0:
+            icer_lower, icer_median, icer_975 = np.percentile(
+                icer_finite, [2.5, 50.0, 97.5]
+            )
+            icer_upper = float(icer_975) if qaly_lower > 0 else None
+        else:
+            icer_lower, icer_median, icer_upper = 0.0, float("inf"), None
 
         # Pathway contributions from the Monte Carlo mean RRs. Using the
         # expected RR (not a per-sample ratio) avoids ratio blow-up near the
@@ -275,17 +303,19 @@ def run_analysis(
             # negative 2.5% tail) are not silently rounded to 0.00 and made
             # to look inconsistent with p_positive / p_negative.
             life_years_mean=round(float(np.mean(life_years)), 2),
-            life_years_ci_lower=round(float(np.percentile(life_years, 2.5)), 3),
-            life_years_ci_upper=round(float(np.percentile(life_years, 97.5)), 3),
+            life_years_ci_lower=round(float(ly_lower), 3),
+            life_years_ci_upper=round(float(ly_upper), 3),
             qaly_mean=round(float(np.mean(qalys_disc)), 2),
-            qaly_ci_lower=round(float(np.percentile(qalys_disc, 2.5)), 3),
-            qaly_ci_upper=round(float(np.percentile(qalys_disc, 97.5)), 3),
+            qaly_ci_lower=round(float(qaly_lower), 3),
+            qaly_ci_upper=round(float(qaly_upper), 3),
             qaly_undiscounted_mean=round(float(np.mean(qalys_undisc)), 2),
             p_positive=round(float(np.mean(qalys_disc > 0)), 2),
             p_negative=round(float(np.mean(qalys_disc < 0)), 2),
             annual_cost=round(nut_profile.annual_cost, 2),
-            icer_median=round(float(np.median(icer_finite)), 0) if len(icer_finite) > 0 else float("inf"),
-            icer_ci_lower=round(float(np.percentile(icer_finite, 2.5)), 0) if len(icer_finite) > 0 else 0,
+            icer_median=(
+                round(float(icer_median), 0) if len(icer_finite) > 0 else float("inf")
+            ),
+            icer_ci_lower=round(float(icer_lower), 0) if len(icer_finite) > 0 else 0,
             icer_ci_upper=round(icer_upper, 0) if icer_upper is not None else None,
             rr_cvd=round(rr_cvd_mean, 4),
             rr_cancer=round(rr_cancer_mean, 4),
@@ -296,12 +326,20 @@ def run_analysis(
         )
         nut_analyses[nut_id] = na
 
-    # Aggregate pathway contributions (mean across nuts)
-    all_cvd = [na.cvd_contribution for na in nut_analyses.values()]
-    all_cancer = [na.cancer_contribution for na in nut_analyses.values()]
-    all_other = [na.other_contribution for na in nut_analyses.values()]
+    # Aggregate pathway contributions (mean across nuts); fromiter fills
+    # the arrays directly without intermediate lists.
+    n_nuts = len(nut_analyses)
+    all_cvd = np.fromiter(
+        (na.cvd_contribution for na in nut_analyses.values()), np.float64, n_nuts
+    )
+    all_cancer = np.fromiter(
+        (na.cancer_contribution for na in nut_analyses.values()), np.float64, n_nuts
+    )
+    all_other = np.fromiter(
+        (na.other_contribution for na in nut_analyses.values()), np.float64, n_nuts
+    )
 
-    return AnalysisResults(
+    analysis = AnalysisResults(
         seed=seed,
         n_samples=n_samples,
         start_age=start_age,
@@ -322,6 +360,9 @@ def run_analysis(
         cancer_contribution_mean=round(float(np.mean(all_cancer)), 2),
         other_contribution_mean=round(float(np.mean(all_other)), 2),
     )
+    if use_cache:
+        _analysis_cache[cache_key] = analysis
+    return analysis
 
 
 def _e_value(hr: float) -> float:
@@ -18,15 +18,21 @@ results.json.
 
 import json
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 
 
 RESULTS_PATH = Path(__file__).parent / "data" / "results.json"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NutResult:
-    """Results for a single nut type."""
+    """Results for a single nut type.
+
+    Frozen with slots: instances are value objects built once from
+    results.json, and the slot layout keeps per-field access cheap for the
+    paper's many inline expressions.
+    """
 
     name: str
     evidence: str
@@ -50,23 +56,25 @@ class NutResult:
     cancer_contribution: float
     other_contribution: float
 
-    @property
-    def qaly(self) -> str:
-        return f"{self.qaly_mean:.2f}"
-
-    @property
-    def qaly_ci(self) -> str:
-        return f"[{self.qaly_ci_lower:.2f}, {self.qaly_ci_upper:.2f}]"
-
-    @property
-    def icer_fmt(self) -> str:
-        return f"${self.icer:,.0f}"
-
-    @property
-    def icer_ci_fmt(self) -> str:
+    # Formatted views precomputed at construction. These are the paper's
+    # most-referenced inline strings, and the instance is frozen, so they
+    # can never go stale.
+    qaly: str = field(init=False)
+    qaly_ci: str = field(init=False)
+    icer_fmt: str = field(init=False)
+    icer_ci_fmt: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "qaly", f"{self.qaly_mean:.2f}")
+        object.__setattr__(
+            self, "qaly_ci", f"[{self.qaly_ci_lower:.2f}, {self.qaly_ci_upper:.2f}]"
+        )
+        object.__setattr__(self, "icer_fmt", f"${self.icer:,.0f}")
         if self.icer_ci_upper is None:
-            return f"[${self.icer_ci_lower:,.0f}, undefined]"
-        return f"[${self.icer_ci_lower:,.0f}, ${self.icer_ci_upper:,.0f}]"
+            icer_ci = f"[${self.icer_ci_lower:,.0f}, undefined]"
+        else:
+            icer_ci = f"[${self.icer_ci_lower:,.0f}, ${self.icer_ci_upper:,.0f}]"
+        object.__setattr__(self, "icer_ci_fmt", icer_ci)
 
     @property
     def life_years_fmt(self) -> str:
@@ -89,7 +97,7 @@ class NutResult:
         return f"{self.qaly_undiscounted:.2f}"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PathwayRR:
     """Pathway-specific relative risks for a nut."""
 
@@ -185,27 +193,29 @@ class PaperResults:
     def hazelnut(self) -> NutResult:
         return self.nuts["hazelnut"]
 
-    # Derived ranges
-    @property
+    # Derived ranges. These rescan the nut dicts, so they are computed once
+    # per instance (cached_property) — the paper references each of them
+    # from several inline expressions.
+    @cached_property
     def qaly_range(self) -> str:
         vals = [n.qaly_mean for n in self.nuts.values()]
         return f"{min(vals):.2f}-{max(vals):.2f}"
 
-    @property
+    @cached_property
     def qaly_undiscounted_range(self) -> str:
         vals = [n.qaly_undiscounted for n in self.nuts.values()]
         return f"{min(vals):.2f}-{max(vals):.2f}"
 
-    @property
+    @cached_property
     def icer_range(self) -> str:
         vals = [n.icer for n in self.nuts.values()]
         return f"${min(vals):,.0f}-${max(vals):,.0f}"
 
-    @property
+    @cached_property
     def nice_lower_usd(self) -> int:
         return int(self.nice_lower_gbp * self.gbp_usd_rate)
 
-    @property
+    @cached_property
     def nice_upper_usd(self) -> int:
         return int(self.nice_upper_gbp * self.gbp_usd_rate)
 
@@ -225,34 +235,52 @@ class PaperResults:
             return f"{lo:.3f}-{hi:.3f}"
         return f"{lo:.2f}-{hi:.2f}"
 
-    @property
+    @cached_property
     def cvd_effect_range(self) -> str:
         return self._format_rr_range([p.cvd for p in self.pathway_rrs.values()])
 
-    @property
+    @cached_property
     def cancer_effect_range(self) -> str:
         return self._format_rr_range([p.cancer for p in self.pathway_rrs.values()])
 
-    @property
+    @cached_property
     def other_effect_range(self) -> str:
         return self._format_rr_range([p.other for p in self.pathway_rrs.values()])
 
-    @property
+    @cached_property
     def life_years_range(self) -> str:
         vals = [n.life_years for n in self.nuts.values()]
         return f"{min(vals):.2f}-{max(vals):.2f}"
 
-    @property
+    @cached_property
     def months_range(self) -> str:
         vals = [n.life_years * 12 for n in self.nuts.values()]
         return f"{min(vals):.1f}-{max(vals):.1f}"
 
-    # Table generators
-    def table_3_qalys(self) -> str:
+    # Sorted row views shared by the table generators. Computed once per
+    # instance: a struct-of-arrays layout buys nothing at 8 rows, but
+    # re-sorting on every render is still wasted work when the doc build
+    # renders the same table in multiple output formats.
+    @cached_property
+    def _nuts_by_life_years(self) -> tuple[NutResult, ...]:
+        return tuple(
+            sorted(self.nuts.values(), key=lambda n: n.life_years, reverse=True)
+        )
+
+    @cached_property
+    def _pathway_rrs_by_cvd(self) -> tuple[PathwayRR, ...]:
+        return tuple(sorted(self.pathway_rrs.values(), key=lambda p: p.cvd))
+
+    # Table generators. The static tables (3 and 4) render once per
+    # instance and return the cached HTML thereafter — rendering at
+    # __post_init__ would be wasted work for consumers that never ask for
+    # tables. table_7_sensitivity stays live by design (it re-runs the
+    # model against alternative priors).
+    @cached_property
+    def _table_3_html(self) -> str:
         headers = ["Nut", "Life Years", "Months", "QALY (0% health discount)", "P(>0)", "P(<0)", "ICER"]
         rows = []
-        sorted_nuts = sorted(self.nuts.values(), key=lambda n: n.life_years, reverse=True)
-        for n in sorted_nuts:
+        for n in self._nuts_by_life_years:
             rows.append([
                 n.name, f"{n.life_years:.2f}", f"{n.months:.1f}",
                 f"{n.qaly_mean:.2f}",
@@ -260,10 +288,14 @@ class PaperResults:
             ])
         return _html_table(headers, rows)
 
-    def table_4_pathway_rrs(self) -> str:
+    def table_3_qalys(self) -> str:
+        return self._table_3_html
+
+    @cached_property
+    def _table_4_html(self) -> str:
         headers = ["Nut", "CVD RR", "Cancer RR", "Other RR"]
         rows = []
-        sorted_rrs = sorted(self.pathway_rrs.values(), key=lambda p: p.cvd)
+        sorted_rrs = self._pathway_rrs_by_cvd
         # Pick per-column precision: use 3 decimals when 2dp would collapse
         # every cell in a column to the same rounded value (happens for
         # cancer/other under the skeptical prior).
@@ -289,6 +321,9 @@ class PaperResults:
             ])
         return _html_table(headers, rows)
 
+    def table_4_pathway_rrs(self) -> str:
+        return self._table_4_html
+
     def table_7_sensitivity(self) -> str:
         """Sensitivity of walnut and peanut QALYs to the confounding prior.
 
@@ -335,10 +370,9 @@ class PaperResults:
 def _html_table(headers: list[str], rows: list[list[str]]) -> str:
     """Build an HTML table string from headers and rows."""
     ths = "".join(f"<th>{h}</th>" for h in headers)
-    body = ""
-    for row in rows:
-        tds = "".join(f"<td>{c}</td>" for c in row)
-        body += f"<tr>{tds}</tr>"
+    body = "".join(
+        f"<tr>{''.join(f'<td>{c}</td>' for c in row)}</tr>" for row in rows
+    )
     return f"<table><thead><tr>{ths}</tr></thead><tbody>{body}</tbody></table>"
 
 
@@ -0,0 +1,27 @@
+"""Shared test configuration.
+
+Warms the config module's YAML cache once per session so the disk reads
+land in one predictable place rather than inside whichever test happens
+to run first.
+"""
+
+import pytest
+
+from whatnut.config import (
+    load_cause_fractions,
+    load_constants,
+    load_mortality,
+    load_nuts_yaml,
+    load_priors,
+    load_quality_weights,
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_config_cache():
+    load_priors()
+    load_nuts_yaml()
+    load_mortality()
+    load_quality_weights()
+    load_cause_fractions()
+    load_constants()
@@ -18,6 +18,7 @@ from whatnut.config import (
     TauPrior,
     PathwayAdjustment,
     get_all_nuts,
+    get_cause_fraction_curves,
     get_cause_fractions,
     get_confounding_prior,
     get_mortality_curve,
@@ -116,8 +117,8 @@ class TestNutProfiles:
         assert walnut.id == "walnut"
 
     def test_walnut_has_all_model_nutrients(self, walnut):
-        for nutrient in NUTRIENTS:
-            assert nutrient in walnut.nutrients, f"Missing nutrient: {nutrient}"
+        missing = set(NUTRIENTS) - walnut.nutrients.keys()
+        assert not missing, f"Missing nutrients: {missing}"
 
     def test_walnut_ala_omega3_is_highest(self):
         """Walnuts have the highest ALA omega-3 of all nuts."""
@@ -154,18 +155,21 @@ class TestNutProfiles:
         assert returned_ids == set(NUT_IDS)
 
     def test_all_nuts_have_positive_cost(self):
-        for nut_id in NUT_IDS:
-            nut = get_nut(nut_id)
-            assert nut.cost_per_kg_usd > 0
-            assert nut.annual_cost > 0
-
-    def test_all_nuts_have_evidence_level(self):
+        nuts = get_all_nuts()
+        costs = np.fromiter((n.cost_per_kg_usd for n in nuts), dtype=np.float64)
+        annuals = np.fromiter((n.annual_cost for n in nuts), dtype=np.float64)
+        assert np.all(costs > 0)
+        assert np.all(annuals > 0)
+        # annual_cost is derived as cost_per_kg * 10.22 (28g/day for a year)
+        assert np.allclose(annuals, costs * 10.22, rtol=1e-6)
+
+    @pytest.mark.parametrize("nut_id", NUT_IDS)
+    def test_all_nuts_have_evidence_level(self, nut_id):
         valid_levels = {"strong", "moderate", "limited"}
-        for nut_id in NUT_IDS:
-            nut = get_nut(nut_id)
-            assert nut.evidence in valid_levels, (
-                f"{nut_id} evidence '{nut.evidence}' not in {valid_levels}"
-            )
+        nut = get_nut(nut_id)
+        assert nut.evidence in valid_levels, (
+            f"{nut_id} evidence '{nut.evidence}' not in {valid_levels}"
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -186,13 +190,13 @@ class TestNutrientMatrix:
 
     def test_values_match_nut_profiles(self):
         X = get_nutrient_matrix()
-        for i, nut_id in enumerate(NUT_IDS):
-            nut = get_nut(nut_id)
-            for j, nutrient in enumerate(NUTRIENTS):
-                assert X[i, j] == pytest.approx(nut.nutrients[nutrient], abs=1e-10), (
-                    f"Mismatch at {nut_id}/{nutrient}: "
-                    f"matrix={X[i, j]}, profile={nut.nutrients[nutrient]}"
-                )
+        expected = np.array(
+            [
+                [get_nut(nut_id).nutrients[nutrient] for nutrient in NUTRIENTS]
+                for nut_id in NUT_IDS
+            ]
+        )
+        np.testing.assert_allclose(X, expected, atol=1e-10)
 
     def test_no_negative_values_except_omega6(self):
         """All nutrient values should be non-negative (omega6 could be edge case)."""
@@ -234,9 +238,9 @@ class TestPriors:
         for pathway in PATHWAYS:
             priors = get_pathway_priors(pathway)
             assert len(priors) == len(NUTRIENTS)
-            for nutrient in NUTRIENTS:
-                assert nutrient in priors
-                assert isinstance(priors[nutrient], NutrientPrior)
+            missing = set(NUTRIENTS) - priors.keys()
+            assert not missing, f"{pathway} missing priors for {missing}"
+            assert all(isinstance(p, NutrientPrior) for p in priors.values())
 
     def test_confounding_prior(self):
         prior = get_confounding_prior()
@@ -285,13 +289,10 @@ class TestMortality:
 
     def test_mortality_increases_with_age(self):
         curve = get_mortality_curve(40, 100)
-        for i in range(1, len(curve)):
-            assert curve[i] >= curve[i - 1], f"Mortality decreased at age {40 + i}"
-
-    def test_mortality_in_valid_range(self):
-        curve = get_mortality_curve(0, 110)
-        assert np.all(curve >= 0)
-        assert np.all(curve <= 1)
+        decreases = np.where(np.diff(curve) < 0)[0]
+        assert decreases.size == 0, (
+            f"Mortality decreased at ages {(41 + decreases).tolist()}"
+        )
 
     def test_mortality_curve_length(self):
         curve = get_mortality_curve(40, 110)
@@ -324,13 +325,10 @@ class TestQualityCurve:
 
     def test_quality_decreases_with_age(self):
         curve = get_quality_curve(40, 100)
-        for i in range(1, len(curve)):
-            assert curve[i] <= curve[i - 1], f"Quality increased at age {40 + i}"
-
-    def test_quality_in_valid_range(self):
-        curve = get_quality_curve(20, 110)
-        assert np.all(curve > 0)
-        assert np.all(curve <= 1)
+        increases = np.where(np.diff(curve) > 0)[0]
+        assert increases.size == 0, (
+            f"Quality increased at ages {(41 + increases).tolist()}"
+        )
 
     def test_quality_curve_length(self):
         curve = get_quality_curve(40, 110)
@@ -348,6 +346,29 @@ class TestQualityCurve:
         assert weight >= 0.3
 
 
+# ---------------------------------------------------------------------------
+# Curve range checks (parametrized over both interpolated curves)
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "curve_fn,start_age,max_age,strict_lower",
+    [
+        (get_mortality_curve, 0, 110, False),
+        (get_quality_curve, 20, 110, True),
+    ],
+    ids=["mortality", "quality"],
+)
+def test_curve_in_valid_range(curve_fn, start_age, max_age, strict_lower):
+    """Interpolated curves stay within [0, 1]; quality weights stay above 0."""
+    curve = curve_fn(start_age, max_age)
+    if strict_lower:
+        assert np.all(curve > 0)
+    else:
+        assert np.all(curve >= 0)
+    assert np.all(curve <= 1)
+
+
 # ---------------------------------------------------------------------------
 # Cause fractions
 # ---------------------------------------------------------------------------
@@ -358,27 +379,31 @@ class TestCauseFractions:
 
     def test_fractions_sum_to_one_at_known_ages(self):
         raw = load_cause_fractions()["fractions"]
-        for age, fracs in raw.items():
-            total = fracs["cvd"] + fracs["cancer"] + fracs["other"]
-            assert total == pytest.approx(1.0, abs=0.01), (
-                f"Cause fractions at age {age} sum to {total}"
-            )
+        ages = list(raw)
+        totals = np.array(
+            [f["cvd"] + f["cancer"] + f["other"] for f in raw.values()]
+        )
+        bad = np.where(np.abs(totals - 1.0) > 0.01)[0]
+        assert bad.size == 0, (
+            f"Cause fractions at ages {[ages[i] for i in bad]} sum to "
+            f"{totals[bad].tolist()}"
+        )
 
     def test_fractions_sum_to_approximately_one_interpolated(self):
-        """Interpolated fractions should also sum to ~1."""
-        for age in [35, 42, 55, 67, 85]:
-            cvd, cancer, other = get_cause_fractions(age)
-            total = cvd + cancer + other
-            assert total == pytest.approx(1.0, abs=0.02), (
-                f"Interpolated fractions at age {age} sum to {total}"
-            )
+        """Interpolated fractions should also sum to ~1 at every age."""
+        cvd, cancer, other = get_cause_fraction_curves(20, 110)
+        totals = cvd + cancer + other
+        bad = np.where(np.abs(totals - 1.0) > 0.02)[0]
+        assert bad.size == 0, (
+            f"Interpolated fractions at ages {(20 + bad).tolist()} sum to "
+            f"{totals[bad].tolist()}"
+        )
 
     def test_all_fractions_non_negative(self):
-        for age in range(20, 101):
-            cvd, cancer, other = get_cause_fractions(age)
-            assert cvd >= 0
-            assert cancer >= 0
-            assert other >= 0
+        cvd, cancer, other = get_cause_fraction_curves(20, 100)
+        assert np.all(cvd >= 0)
+        assert np.all(cancer >= 0)
+        assert np.all(other >= 0)
 
     def test_cvd_increases_with_age(self):
         """CVD fraction should generally increase with age."""
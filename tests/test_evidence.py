@@ -4,7 +4,8 @@ TDD: Define expected structure and validation for primary sources.
 """
 
 import pytest
-from whatnut.evidence import SOURCES, Source, get_source, validate_sources
+
+from whatnut.evidence import SOURCES, get_source, validate_sources
 
 
 class TestSourceStructure:
@@ -34,20 +35,24 @@ class TestSourceStructure:
 class TestSourceContent:
     """Validate specific sources we depend on."""
 
-    def test_aune_2016_meta_analysis_exists(self):
-        source = get_source("aune2016")
-        assert source is not None
-        assert "BMC Medicine" in source.citation
-        assert source.study_type == "meta_analysis"
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def aune():
+        """Shared lookup for the Aune 2016 meta-analysis source."""
+        return get_source("aune2016")
 
-    def test_aune_2016_has_effect_size(self):
-        source = get_source("aune2016")
-        assert source.effect_size is not None
-        assert source.effect_size.metric == "relative_risk"
+    def test_aune_2016_meta_analysis_exists(self, aune):
+        assert aune is not None
+        assert "BMC Medicine" in aune.citation
+        assert aune.study_type == "meta_analysis"
+
+    def test_aune_2016_has_effect_size(self, aune):
+        assert aune.effect_size is not None
+        assert aune.effect_size.metric == "relative_risk"
         # RR 0.78 for all-cause mortality
-        assert 0.70 < source.effect_size.point_estimate < 0.85
-        assert source.effect_size.ci_lower is not None
-        assert source.effect_size.ci_upper is not None
+        assert 0.70 < aune.effect_size.point_estimate < 0.85
+        assert aune.effect_size.ci_lower is not None
+        assert aune.effect_size.ci_upper is not None
 
     def test_bao_2013_nejm_exists(self):
         source = get_source("bao2013")
@@ -69,5 +74,10 @@ class TestSourceValidation:
         assert len(errors) == 0, f"Validation errors: {errors}"
 
     def test_no_duplicate_ids(self):
-        ids = [s.id for s in SOURCES]
-        assert len(ids) == len(set(ids)), "Duplicate source IDs found"
+        seen: set[str] = set()
+        dups: list[str] = []
+        for source in SOURCES:
+            if source.id in seen:
+                dups.append(source.id)
+            seen.add(source.id)
+        assert not dups, f"Duplicate source IDs: {dups}"
@@ -8,7 +8,7 @@ Uses n_samples=100 for speed.
 import numpy as np
 import pytest
 
-from whatnut.config import NUT_IDS, PATHWAYS, NUTRIENTS
+from whatnut.config import NUT_IDS, PATHWAYS
 from whatnut.model import ModelSamples, sample_model, summarize_rr
 
 
@@ -26,6 +26,12 @@ def samples_default() -> ModelSamples:
     return sample_model(n_samples=N_FAST, seed=42)
 
 
+@pytest.fixture(scope="module")
+def nut_idx() -> dict[str, int]:
+    """Column index for each nut in default-order sample arrays."""
+    return {nut_id: i for i, nut_id in enumerate(NUT_IDS)}
+
+
 @pytest.fixture(scope="module")
 def samples_subset() -> ModelSamples:
     """Samples with a subset of nuts."""
@@ -88,18 +94,20 @@ class TestRRDistributions:
     def test_mean_rr_in_sensible_range(self, samples_default):
         """Mean RR for each pathway/nut should be in [0.5, 1.2]."""
         for pathway in PATHWAYS:
-            for j, nut_id in enumerate(samples_default.nut_ids):
-                mean_rr = np.mean(samples_default.rr[pathway][:, j])
-                assert 0.5 <= mean_rr <= 1.2, (
-                    f"{pathway}/{nut_id}: mean RR = {mean_rr:.4f} outside [0.5, 1.2]"
-                )
+            means = np.mean(samples_default.rr[pathway], axis=0)
+            assert np.all((means >= 0.5) & (means <= 1.2)), (
+                f"{pathway}: mean RRs outside [0.5, 1.2]: "
+                f"{dict(zip(samples_default.nut_ids, np.round(means, 4).tolist()))}"
+            )
 
     def test_rr_has_variance(self, samples_default):
         """Each RR distribution should show non-zero variance."""
         for pathway in PATHWAYS:
-            for j in range(len(samples_default.nut_ids)):
-                std = np.std(samples_default.rr[pathway][:, j])
-                assert std > 0, f"Zero variance for pathway {pathway}, nut index {j}"
+            stds = np.std(samples_default.rr[pathway], axis=0)
+            zero = np.where(stds == 0)[0]
+            assert zero.size == 0, (
+                f"Zero variance for pathway {pathway}, nut indices {zero.tolist()}"
+            )
 
     def test_causal_fraction_in_zero_one(self, samples_default):
         """Causal fraction samples should be in (0, 1)."""
@@ -112,13 +120,11 @@ class TestRRDistributions:
         mean_cf = np.mean(samples_default.causal_fraction)
         assert mean_cf == pytest.approx(0.2, abs=0.08)
 
-    def test_walnut_cvd_rr_tends_low(self):
+    def test_walnut_cvd_rr_tends_low(self, nut_idx):
         """Walnuts (high ALA) should have lower CVD RR than peanuts (no ALA)."""
         samples = sample_model(n_samples=500, seed=42)
-        walnut_idx = samples.nut_ids.index("walnut")
-        peanut_idx = samples.nut_ids.index("peanut")
-        walnut_cvd_mean = np.mean(samples.rr["cvd"][:, walnut_idx])
-        peanut_cvd_mean = np.mean(samples.rr["cvd"][:, peanut_idx])
+        walnut_cvd_mean = np.mean(samples.rr["cvd"][:, nut_idx["walnut"]])
+        peanut_cvd_mean = np.mean(samples.rr["cvd"][:, nut_idx["peanut"]])
         # Both should be < 1, walnut likely lower (more protective)
         assert walnut_cvd_mean < 1.0
         assert peanut_cvd_mean < 1.0
@@ -263,16 +269,16 @@ class TestSummarizeRR:
 class TestPathwayAdjustments:
     """Pathway adjustments from nuts.yaml should modify model output."""
 
-    def test_walnut_cvd_adjusted_more_than_almond(self):
+    def test_walnut_cvd_adjusted_more_than_almond(self, nut_idx):
         """Walnut CVD adjustment (1.25) > almond (1.00), so walnut CVD RR
         should be lower (more protective) relative to nutrient predictions."""
-        samples = sample_model(n_samples=1000, seed=42)
-        walnut_idx = samples.nut_ids.index("walnut")
-        almond_idx = samples.nut_ids.index("almond")
+        # n=200 is ample: the comparison is between seeded means separated
+        # by far more than their Monte Carlo error at this sample size.
+        samples = sample_model(n_samples=200, seed=42)
         # Walnut has stronger CVD adjustment (1.25 > 1.00)
         # So walnut CVD effect should be amplified
-        walnut_cvd = np.mean(samples.rr["cvd"][:, walnut_idx])
-        almond_cvd = np.mean(samples.rr["cvd"][:, almond_idx])
+        walnut_cvd = np.mean(samples.rr["cvd"][:, nut_idx["walnut"]])
+        almond_cvd = np.mean(samples.rr["cvd"][:, nut_idx["almond"]])
         # Walnut has 2.5g ALA + 1.25 adj, almond has 0g ALA + 1.00 adj
         # Walnut should have lower CVD RR
         assert walnut_cvd < almond_cvd, (
@@ -313,16 +319,15 @@ class TestStudyQualityShrinkage:
         limited_shrunk = 1.0 + (1.10 - 1.0) * s.retention("limited")
         assert strong_shrunk > limited_shrunk > 1.0
 
-    def test_model_applies_shrinkage(self):
+    def test_model_applies_shrinkage(self, nut_idx):
         """A synthetic walnut with identical priors but a limited-tier
         evidence flag should produce weaker CVD protection than the real
         'strong'-tier walnut. Exercised via sample_model path."""
         # Sample with tiered shrinkage on; the real walnut is 'strong',
         # so its shrunk adjustment is smaller than its nominal 1.10 but
         # still > 1.0.
-        samples = sample_model(n_samples=2000, seed=42)
-        walnut_idx = samples.nut_ids.index("walnut")
-        walnut_rr_cvd = np.mean(samples.rr["cvd"][:, walnut_idx])
+        samples = sample_model(n_samples=500, seed=42)
+        walnut_rr_cvd = np.mean(samples.rr["cvd"][:, nut_idx["walnut"]])
         # The final CVD RR for walnut should still be < 1 (protective)
         # but materially weaker than the untilted prior would imply.
         assert walnut_rr_cvd < 1.0
@@ -331,17 +336,19 @@ class TestStudyQualityShrinkage:
 class TestHRCentering:
     """hr_centered=True applies a Jensen shift reducing mean log-RR."""
 
-    def test_hr_centering_reduces_mean_log_rr(self):
+    def test_hr_centering_reduces_mean_log_rr(self, nut_idx):
         """With HR-centering on, the mean sampled RR should be very slightly
         more protective than without (because log_RR is shifted down by
         variance/2 before confounding)."""
-        on = sample_model(n_samples=5000, seed=42, hr_centered=True)
-        off = sample_model(n_samples=5000, seed=42, hr_centered=False)
-        walnut_idx = on.nut_ids.index("walnut")
+        # Direction-only comparison: with a shared seed the draws are
+        # identical and the Jensen shift lowers every sample's log-RR, so
+        # the inequality holds at any n; 2000 keeps the means stable.
+        on = sample_model(n_samples=2000, seed=42, hr_centered=True)
+        off = sample_model(n_samples=2000, seed=42, hr_centered=False)
         # Centered mean RR should be at least as small (protective) as
         # uncentered. The gap is small (<0.3pp) but directionally pinned.
-        on_mean = np.mean(on.rr["cvd"][:, walnut_idx])
-        off_mean = np.mean(off.rr["cvd"][:, walnut_idx])
+        on_mean = np.mean(on.rr["cvd"][:, nut_idx["walnut"]])
+        off_mean = np.mean(off.rr["cvd"][:, nut_idx["walnut"]])
         assert on_mean <= off_mean + 1e-6
 
     def test_hr_centering_preserves_rr_sanity(self):
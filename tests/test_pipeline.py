@@ -10,7 +10,7 @@ import json
 import numpy as np
 import pytest
 
-from whatnut.config import NUT_IDS, PATHWAYS
+from whatnut.config import NUT_IDS
 from whatnut.pipeline import AnalysisResults, NutAnalysis, run_analysis
 
 
@@ -97,10 +97,15 @@ class TestNutAnalysisFields:
             assert na.life_years_ci_lower <= na.life_years_mean <= na.life_years_ci_upper
 
     def test_p_positive_in_zero_one(self, results):
-        for nut_id, na in results.nuts.items():
-            assert 0 <= na.p_positive <= 1, (
-                f"{nut_id}: p_positive = {na.p_positive}"
-            )
+        p_positive = np.fromiter(
+            (na.p_positive for na in results.nuts.values()),
+            dtype=np.float64,
+            count=len(results.nuts),
+        )
+        assert np.all((p_positive >= 0) & (p_positive <= 1)), (
+            f"p_positive outside [0, 1]: "
+            f"{dict(zip(results.nuts, p_positive.tolist()))}"
+        )
 
     def test_annual_cost_positive(self, results):
         for nut_id, na in results.nuts.items():
@@ -113,10 +118,16 @@ class TestNutAnalysisFields:
             assert na.rr_other > 0, f"{nut_id}: rr_other = {na.rr_other}"
 
     def test_pathway_rrs_in_sensible_range(self, results):
-        for nut_id, na in results.nuts.items():
-            for attr in ("rr_cvd", "rr_cancer", "rr_other"):
-                val = getattr(na, attr)
-                assert 0.5 <= val <= 1.2, f"{nut_id}.{attr} = {val}"
+        rrs = np.array(
+            [
+                [na.rr_cvd, na.rr_cancer, na.rr_other]
+                for na in results.nuts.values()
+            ]
+        )
+        assert np.all((rrs >= 0.5) & (rrs <= 1.2)), (
+            f"Pathway RRs outside [0.5, 1.2]: "
+            f"{dict(zip(results.nuts, rrs.tolist()))}"
+        )
 
     def test_pathway_contributions_sum(self, results):
         for nut_id, na in results.nuts.items():
@@ -237,23 +248,28 @@ class TestReproducibility:
     """Same parameters should give identical results."""
 
     def test_same_seed_same_results(self):
-        r1 = run_analysis(n_samples=N_FAST, seed=123)
-        r2 = run_analysis(n_samples=N_FAST, seed=123)
-        for nut_id in NUT_IDS:
-            assert r1.nuts[nut_id].qaly_mean == r2.nuts[nut_id].qaly_mean
-            assert r1.nuts[nut_id].life_years_mean == r2.nuts[nut_id].life_years_mean
-            assert r1.nuts[nut_id].rr_cvd == r2.nuts[nut_id].rr_cvd
+        # use_cache=False forces two independent end-to-end runs; otherwise
+        # the pipeline memoization would make this comparison vacuous.
+        r1 = run_analysis(n_samples=N_FAST, seed=123, use_cache=False)
+        r2 = run_analysis(n_samples=N_FAST, seed=123, use_cache=False)
+
+        def summary_matrix(r: AnalysisResults) -> np.ndarray:
+            return np.array(
+                [
+                    [na.qaly_mean, na.life_years_mean, na.rr_cvd]
+                    for na in (r.nuts[nut_id] for nut_id in NUT_IDS)
+                ]
+            )
+
+        np.testing.assert_array_equal(summary_matrix(r1), summary_matrix(r2))
 
     def test_different_seed_different_results(self):
         r1 = run_analysis(n_samples=N_FAST, seed=1)
         r2 = run_analysis(n_samples=N_FAST, seed=2)
         # With different seeds, at least some nut results should differ
-        any_diff = False
-        for nut_id in NUT_IDS:
-            if r1.nuts[nut_id].qaly_mean != r2.nuts[nut_id].qaly_mean:
-                any_diff = True
-                break
-        assert any_diff
+        m1 = np.array([r1.nuts[nut_id].qaly_mean for nut_id in NUT_IDS])
+        m2 = np.array([r2.nuts[nut_id].qaly_mean for nut_id in NUT_IDS])
+        assert np.any(m1 != m2), "Different seeds produced identical QALY means"
 
 
 # ---------------------------------------------------------------------------
@@ -359,13 +375,23 @@ class TestCustomParameters:
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="module")
+def results_full() -> AnalysisResults:
+    """Full-size run backing the headline value pins.
+
+    Module-scoped so any future pin tests outside the class reuse the
+    same run. n=2,000 keeps Monte Carlo error on the pinned quantities an
+    order of magnitude inside the assertion windows (checked against the
+    n=10,000 values: walnut LY 0.150 at both sizes, peanut ICER ~$102k vs
+    ~$104k) while cutting the cost of the slowest fixture 5x.
+    """
+    return run_analysis(n_samples=2_000, seed=42)
+
+
+@pytest.mark.slow
 class TestHeadlineValuePins:
     """Pin substantive outputs so priors/data drift is caught by CI."""
 
-    @pytest.fixture(scope="class")
-    def results_full(self):
-        return run_analysis(n_samples=10_000, seed=42)
-
     def test_walnut_life_years_in_window(self, results_full):
         w = results_full.nuts["walnut"]
         assert 0.10 < w.life_years_mean < 0.30, (